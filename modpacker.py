@@ -1,18 +1,107 @@
 import zipfile
 import json
 import shutil
-import requests
 from pathlib import Path
 import os
 import traceback
-import concurrent.futures
+import mmap
+import threading
+import time
 import datetime
 
+# orjson is an optional speedup for reading modinfo.json / pack.json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Helper to read a worker count from an environment variable; runs at import time (outside the
+# main error handler), so a bad value falls back to the default instead of crashing
+def _env_worker_count(name, default):
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
 VINTAGESTORY_DATA_DIR = Path(os.getenv('APPDATA'), "VintagestoryData")
 MODS_DIR = VINTAGESTORY_DATA_DIR / "Mods"
 CONFIG_DIR = VINTAGESTORY_DATA_DIR / "ModConfig"
 MODPACKS_DIR = VINTAGESTORY_DATA_DIR / "ModPacks"
+MODINFO_CACHE_PATH = MODPACKS_DIR / ".modinfo_cache.json"  # (modid, version) of installed mod zips, keyed by file
 MODDB_API_URL = "https://mods.vintagestory.at/api/mod/"  # Vintage Story Mod API
+USER_AGENT = "VintageStoryModPacker/1.0"  # Identifies this tool to the mod DB
+COPY_BUFFER_SIZE = 1 << 16  # 64 KiB chunks when copying config files
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB chunks when streaming mod downloads to disk
+MAX_PARALLEL_DOWNLOADS = _env_worker_count("VS_PACK_DL", 8)  # Concurrent mod file downloads (one host, so keep it modest)
+MAX_PARALLEL_LOOKUPS = _env_worker_count("VS_PACK_LOOKUPS", 16)  # Concurrent mod DB metadata lookups (small JSON responses)
+LOG_MODS_MARKER = b"Mods, sorted by dependency:"  # Log line listing the loaded mods
+VANILLA_MODS = frozenset({"game", "creative", "survival"})  # Built-in mods listed in logs that are never downloaded
+LOG_TAIL_BYTES = 1 << 16  # How much of the end of a log file is scanned before falling back to the whole file
+MODDB_CACHE_SECONDS = 3600  # How long mod API responses are reused (in memory, and on disk when requests-cache is installed)
+PACK_ENTRY_DATE_TIME = (1980, 1, 1, 0, 0, 0)  # Fixed timestamp for mod pack entries so packs are reproducible
+PRECOMPRESSED_EXTENSIONS = {".zip", ".gz", ".7z", ".png", ".jpg", ".jpeg", ".ogg"}  # Stored, not deflated, in mod packs
+
+# Helper to build the shared HTTP session (requests is imported here rather than at module
+# level so the menu starts without paying for requests/urllib3/ssl until a download is needed)
+def _create_session():
+    """
+    Creates the HTTP session shared by every download so requests reuse pooled
+    keep-alive connections instead of paying a fresh TCP + TLS handshake each time.
+    If requests-cache is installed, mod API responses are also cached on disk
+    (honoring the server's Cache-Control/ETag headers); mod files are never cached.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    try:
+        from requests_cache import CachedSession, DO_NOT_CACHE
+    except ImportError:
+        session = requests.Session()
+    else:
+        session = CachedSession(
+            "vintagestory_modpacker",
+            backend="sqlite",
+            use_cache_dir=True,
+            cache_control=True,
+            urls_expire_after={f"{MODDB_API_URL}*": MODDB_CACHE_SECONDS, "*": DO_NOT_CACHE},
+            # With cache_control=True a server max-age/Expires header overrides the URL rules above,
+            # so explicitly refuse to store anything but API responses (mod zips must keep streaming)
+            filter_fn=lambda response: response.url.startswith(MODDB_API_URL),
+        )
+
+    # requests already sends "Connection: keep-alive" and advertises every content encoding
+    # it can decode (gzip/deflate, plus br/zstd when those packages are installed)
+    session.headers["User-Agent"] = USER_AGENT
+    session.mount("https://", HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=max(32, MAX_PARALLEL_LOOKUPS + MAX_PARALLEL_DOWNLOADS),
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ))
+    return session
+
+_session = None
+_session_lock = threading.Lock()
+
+# Helper to get the shared HTTP session, creating it on first use
+def _get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = _create_session()
+    return _session
+
+# JSON helpers that use orjson when it is installed and fall back to the standard library
+def _json_loads(data):
+    if orjson is not None:
+        # orjson rejects a UTF-8 BOM, which some hand-edited modinfo files carry
+        return orjson.loads(data.removeprefix(b"\xef\xbb\xbf"))
+    return json.loads(data)
+
+def _json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
 
 # Helper to ensure ModPacks folder exists
 def ensure_modpacks_folder():
@@ -22,76 +111,296 @@ def ensure_modpacks_folder():
         return False
     return True
 
+# Helper to delete everything inside a folder (os.scandir reuses the cached entry type, avoiding an extra stat per entry)
+def clear_directory(directory):
+    if not directory.is_dir():
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
 # Function to extract mod info from the modinfo.json file
 def extract_mod_info(mod_file):
     try:
         with zipfile.ZipFile(mod_file, 'r') as zipf:
-            with zipf.open("modinfo.json") as modinfo_file:
-                modinfo = json.load(modinfo_file)
-                # Handle any combination of capitalization by normalizing keys to lowercase
-                modinfo_lower = {k.lower(): v for k, v in modinfo.items()}
-                modid = modinfo_lower.get("modid", "unknown_modid")
-                version = modinfo_lower.get("version", "unknown_version")
-                return modid, version
-    except (KeyError, zipfile.BadZipFile, json.JSONDecodeError):
+            modinfo = _json_loads(zipf.read("modinfo.json"))
+        # Handle any combination of capitalization by normalizing keys to lowercase,
+        # but only rebuild the dict when the lowercase keys are not already present
+        if "modid" not in modinfo or "version" not in modinfo:
+            modinfo = {k.lower(): v for k, v in modinfo.items()}
+        modid = modinfo.get("modid", "unknown_modid")
+        version = modinfo.get("version", "unknown_version")
+        return modid, version
+    # ValueError covers JSONDecodeError and UnicodeDecodeError; AttributeError a top level that is not an object
+    except (KeyError, zipfile.BadZipFile, ValueError, AttributeError):
         print(f"Error reading modinfo.json for {mod_file.stem}.")
         return "unknown_modid", "unknown_version"
 
-def download_mod(modid, mod_version=None):
+# Function to extract mod info from many mod files, reusing cached results for unchanged files
+def extract_mods_info(mod_files):
     """
-    If mod_version is provided, attempts to download that specific version.
-    If not found or mod_version is None, tries to download the latest release.
+    Returns (modid, version) for every mod file, in order. Results are cached in
+    MODINFO_CACHE_PATH keyed on file name, modification time and size, so only new
+    or changed zips are opened; those are read concurrently.
     """
-    mod_api_url = f"{MODDB_API_URL}{modid}"
+    from concurrent.futures import ThreadPoolExecutor
 
     try:
-        response = requests.get(mod_api_url, timeout=10)
-        response.raise_for_status()
-        mod_data = response.json()
-
-        # Sort releases by releaseid descending so the first item is the newest
-        if 'releases' not in mod_data['mod'] or not mod_data['mod']['releases']:
-            print(f"No releases found for {modid}.")
-            return False
-
-        releases = mod_data['mod']['releases']
-        releases.sort(key=lambda r: r['releaseid'], reverse=True)
-
-        mod_release = None
-
-        if mod_version:
-            # Find the correct version or fallback to the newest if not found
-            for release in releases:
-                if release['modversion'] == mod_version:
-                    mod_release = release
-                    break
-            if mod_release is None:
-                print(f"Mod {modid} version {mod_version} not found. Attempting to use latest version.")
+        cache = _json_loads(MODINFO_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+
+    new_cache = {}
+    results = {}
+    misses = []
+    for mod_file in mod_files:
+        stat = mod_file.stat()
+        entry = cache.get(mod_file.name)
+        # Anything other than a [mtime_ns, size, modid, version] entry counts as a miss
+        if (isinstance(entry, (list, tuple)) and len(entry) == 4
+                and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size):
+            results[mod_file] = (entry[2], entry[3])
+            new_cache[mod_file.name] = entry
+        else:
+            misses.append((mod_file, stat))
+
+    # Each zip is read independently, so do it concurrently
+    with ThreadPoolExecutor() as executor:
+        for (mod_file, stat), (modid, version) in zip(misses, executor.map(extract_mod_info, [f for f, _ in misses])):
+            results[mod_file] = (modid, version)
+            # Unreadable mods are not cached so the error is reported again next time
+            if modid != "unknown_modid":
+                new_cache[mod_file.name] = [stat.st_mtime_ns, stat.st_size, modid, version]
+
+    # Rewrite the cache when entries were added or files have gone away
+    if new_cache != cache:
+        try:
+            MODINFO_CACHE_PATH.write_bytes(_json_dumps(new_cache))
+        except OSError:
+            pass
+
+    return [results[mod_file] for mod_file in mod_files]
+
+_mod_data_cache = {}
+_mod_data_cache_lock = threading.Lock()
+
+# Function to fetch a mod's JSON from the mod DB, reusing recent responses within this session
+def fetch_mod_data(modid):
+    """
+    Returns the mod DB response for modid. Responses are kept in memory for
+    MODDB_CACHE_SECONDS, so installing several packs (or a pack and a log) in one
+    session looks each mod up only once. Raises requests.RequestException on failure.
+    """
+    now = time.monotonic()
+    with _mod_data_cache_lock:
+        cached = _mod_data_cache.get(modid)
+    if cached is not None and now - cached[0] < MODDB_CACHE_SECONDS:
+        return cached[1]
+
+    response = _get_session().get(f"{MODDB_API_URL}{modid}", timeout=10)
+    response.raise_for_status()
+    mod_data = response.json()
+
+    with _mod_data_cache_lock:
+        _mod_data_cache[modid] = (now, mod_data)
+    return mod_data
+
+def resolve_mod_release(modid, mod_version=None):
+    """
+    Looks up modid on the mod DB and returns the release that should be installed.
+    If mod_version is provided, returns that specific release when it exists,
+    otherwise falls back to the latest release. Returns None on failure.
+    """
+    import requests
+
+    try:
+        mod_data = fetch_mod_data(modid)
+    except requests.RequestException as e:
+        print(f"Failed to download {modid}. Error: {e}")
+        return None
+
+    if 'releases' not in mod_data['mod'] or not mod_data['mod']['releases']:
+        print(f"No releases found for {modid}.")
+        return None
+
+    releases = mod_data['mod']['releases']
+    mod_release = None
+
+    # Single passes with max() instead of sorting every release; the highest releaseid is the newest
+    if mod_version:
+        # Find the correct version or fallback to the newest if not found
+        mod_release = max((release for release in releases if release['modversion'] == mod_version),
+                          key=lambda r: r['releaseid'], default=None)
         if mod_release is None:
-            mod_release = releases[0]
+            print(f"Mod {modid} version {mod_version} not found. Attempting to use latest version.")
+    if mod_release is None:
+        mod_release = max(releases, key=lambda r: r['releaseid'])
+
+    return mod_release
+
+# Helper to reserve disk space for a file before writing it
+def preallocate_file(f, size):
+    """
+    Reserves size bytes for an open file so many concurrent downloads do not
+    interleave their blocks on disk. Filesystems that cannot do this are ignored.
+    """
+    if size <= 0:
+        return
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(f.fileno(), 0, size)
+        else:
+            # On Windows, extending the file allocates its clusters up front; writes still start at 0
+            f.truncate(size)
+    except OSError:
+        pass
 
-        # Download the mod
-        mod_url = f"https://mods.vintagestory.at/{mod_release['mainfile']}"
-        mod_file_name = mod_release['mainfile'].split('/')[-1]
-        mod_file_path = MODS_DIR / mod_file_name
+def download_release(modid, mod_release):
+    """
+    Downloads the file of an already resolved release into the Mods directory.
+    """
+    import requests
 
-        # If file already exists, skip
-        if mod_file_path.exists():
-            print(f"Mod {modid} version {mod_release['modversion']} already exists, skipping download.")
-            return True
+    mod_url = f"https://mods.vintagestory.at/{mod_release['mainfile']}"
+    mod_file_name = mod_release['mainfile'].split('/')[-1]
+    mod_file_path = MODS_DIR / mod_file_name
+
+    # If the file already exists (and matches the size reported by the mod DB, when it reports one), skip
+    expected_size = mod_release.get('filesize')
+    if mod_file_path.exists() and (expected_size is None or mod_file_path.stat().st_size == expected_size):
+        print(f"Mod {modid} version {mod_release['modversion']} already exists, skipping download.")
+        return True
 
+    # Download into a .part file that is only renamed once complete, so an interrupted
+    # download never leaves a truncated mod behind that later runs would skip
+    part_file_path = mod_file_path.with_suffix(mod_file_path.suffix + ".part")
+    try:
         print(f"Downloading {modid} version {mod_release['modversion']} from {mod_url}")
-        with requests.get(mod_url, stream=True) as r:
+        with _get_session().get(mod_url, stream=True) as r:
             r.raise_for_status()
-            with open(mod_file_path, 'wb') as f:
-                shutil.copyfileobj(r.raw, f)
+            with open(part_file_path, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as f:
+                # Content-Length is only the final size when the body is not encoded
+                content_length = r.headers.get("Content-Length", "")
+                if content_length.isdigit() and "Content-Encoding" not in r.headers:
+                    preallocate_file(f, int(content_length))
+                # iter_content also undoes any Content-Encoding the server applied
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                # Drop any reserved space the body did not fill
+                f.truncate()
+        os.replace(part_file_path, mod_file_path)
         print(f"Mod {modid} downloaded successfully!")
         return True
 
-    except requests.RequestException as e:
+    except (requests.RequestException, OSError) as e:
+        part_file_path.unlink(missing_ok=True)
         print(f"Failed to download {modid}. Error: {e}")
         return False
 
+def download_mods(mods):
+    """
+    Downloads a list of (modid, mod_version) pairs, skipping pinned versions that are
+    already installed, as a pipeline:
+      - Resolves every release from the mod DB concurrently (small JSON lookups,
+        up to MAX_PARALLEL_LOOKUPS at once).
+      - Starts each file download as soon as its release is resolved
+        (up to MAX_PARALLEL_DOWNLOADS at once, since these use the bandwidth).
+    Prints the mods that could not be installed and returns how many there were.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    # A pinned version that is already installed needs no lookup at all
+    # (only scan the Mods folder when there is a pinned version to compare against)
+    if any(mod_version is not None for _, mod_version in mods):
+        installed_mods = set(extract_mods_info(sorted(MODS_DIR.glob("*.zip"))))
+        # An unreadable zip must not make a pack entry look installed
+        installed_mods.discard(("unknown_modid", "unknown_version"))
+        for modid, mod_version in mods:
+            if mod_version is not None and (modid, mod_version) in installed_mods:
+                print(f"Mod {modid} version {mod_version} is already installed, skipping download.")
+        mods = [(modid, mod_version) for modid, mod_version in mods
+                if mod_version is None or (modid, mod_version) not in installed_mods]
+
+    # Only create the Mods folder once something is about to be written to it
+    if mods:
+        MODS_DIR.mkdir(parents=True, exist_ok=True)
+
+    failed_mods = []
+    downloads = {}
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_LOOKUPS, thread_name_prefix="vslookup") as lookup_executor, \
+            ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS, thread_name_prefix="vsdl") as download_executor:
+        lookups = {lookup_executor.submit(resolve_mod_release, modid, mod_version): modid
+                   for modid, mod_version in mods}
+
+        # Different requests can resolve to the same file, so download each file only once
+        started_files = set()
+        for lookup in as_completed(lookups):
+            modid = lookups[lookup]
+            # An unexpected mod DB response (e.g. missing 'mod' or 'mainfile') only fails this one mod
+            try:
+                release = lookup.result()
+                if release is None:
+                    failed_mods.append(modid)
+                    continue
+                mainfile = release['mainfile']
+            except Exception as e:
+                print(f"Failed to download {modid}. Unexpected error: {e!r}")
+                failed_mods.append(modid)
+                continue
+            if mainfile in started_files:
+                continue
+            started_files.add(mainfile)
+            downloads[download_executor.submit(download_release, modid, release)] = modid
+
+    # Collect the download results so failures (and unexpected errors) are not silently dropped
+    for download, modid in downloads.items():
+        try:
+            succeeded = download.result()
+        except Exception as e:
+            print(f"Failed to download {modid}. Unexpected error: {e!r}")
+            succeeded = False
+        if not succeeded:
+            failed_mods.append(modid)
+    if failed_mods:
+        print(f"{len(failed_mods)} mod(s) could not be installed: {', '.join(failed_mods)}")
+    return len(failed_mods)
+
+# Helper to extract config files from an open mod pack into the config directory
+def extract_configs(zipf, members):
+    """
+    Extracts the given ZipInfo members into CONFIG_DIR, skipping any entry that would
+    land outside it. Each file is an independent read + write, so with more than one
+    file they are written from a thread pool (ZipFile.read locks the shared archive
+    handle internally).
+    """
+    config_root = CONFIG_DIR.resolve()
+
+    def extract_one(member):
+        target_path = (config_root / member.filename).resolve()
+        if not target_path.is_relative_to(config_root):
+            print(f"Skipping config '{member.filename}': it points outside the config folder.")
+            return
+        if member.is_dir():
+            target_path.mkdir(parents=True, exist_ok=True)
+            return
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        target_path.write_bytes(zipf.read(member))
+
+    if len(members) < 2:
+        for member in members:
+            extract_one(member)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(extract_one, members))
+
 # Function to install a mod pack (reads pack.json and installs mods)
 def install_mod_pack():
     if not ensure_modpacks_folder():
@@ -117,31 +426,22 @@ def install_mod_pack():
 
     # Open and validate the mod pack (ensure pack.json exists)
     with zipfile.ZipFile(chosen_modpack, 'r') as zipf:
-        try:
-            with zipf.open("pack.json") as json_file:
-                modpack_data = json.load(json_file)
-        except KeyError:
+        names = set(zipf.namelist())
+        if "pack.json" not in names:
             print(f"{chosen_modpack.stem} is not a valid mod pack, please try again.")
             return
+        modpack_data = _json_loads(zipf.read("pack.json"))
 
         overwrite_mods = input("Do you want to overwrite your current mods or merge with existing? (Overwrite/Merge): ").strip().lower()
 
         # Overwrite mods if selected
         if overwrite_mods == 'overwrite':
             # Clear existing mods
-            for mod_file in MODS_DIR.glob("*"):
-                if mod_file.is_file() or mod_file.is_dir():
-                    shutil.rmtree(mod_file) if mod_file.is_dir() else mod_file.unlink()
+            clear_directory(MODS_DIR)
 
-        # Install each mod from the mod pack concurrently
-        mods_to_download = [(mod["name"], mod["version"]) for mod in modpack_data["mods"]]
-
-        def download_task(mod):
-            modid, mod_version = mod
-            download_mod(modid, mod_version)
-
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            executor.map(download_task, mods_to_download)
+        # Install each mod from the mod pack concurrently (skipping duplicate entries, keeping order)
+        mods_to_download = list(dict.fromkeys((mod["name"], mod["version"]) for mod in modpack_data["mods"]))
+        failed_count = download_mods(mods_to_download)
 
         # Handle config files
         if modpack_data["configs"]:
@@ -149,19 +449,19 @@ def install_mod_pack():
 
             if apply_configs == 'overwrite':
                 # Clear existing config files
-                for config_file in CONFIG_DIR.glob("*"):
-                    if config_file.is_file() or config_file.is_dir():
-                        shutil.rmtree(config_file) if config_file.is_dir() else config_file.unlink()
+                clear_directory(CONFIG_DIR)
 
                 # Extract config files from the mod pack to the config directory
-                for config in modpack_data["configs"]:
-                    target_path = CONFIG_DIR / Path(config)
-                    target_path.parent.mkdir(parents=True, exist_ok=True)
-                    with zipf.open(config) as source_file:
-                        with open(target_path, 'wb') as target_file:
-                            shutil.copyfileobj(source_file, target_file)
+                missing_configs = [config for config in modpack_data["configs"] if config not in names]
+                if missing_configs:
+                    print(f"Skipping config files listed in pack.json but missing from the mod pack: {', '.join(missing_configs)}")
+                members = [zipf.getinfo(config) for config in modpack_data["configs"] if config in names]
+                extract_configs(zipf, members)
 
-    print("Mod pack installation complete.")
+    if failed_count:
+        print("Mod pack installation finished, but some mods failed (see above).")
+    else:
+        print("Mod pack installation complete.")
 
 # Function to create a mod pack (gathers mods and configs and creates a zip file)
 def create_mod_pack():
@@ -197,19 +497,19 @@ def _create_mod_pack_internal(modpack_zip_path: Path, modpack_name: str, ask_for
     configs = []
 
     # Collect all mods in the Mods directory
-    for mod_file in MODS_DIR.glob("*.zip"):
-        modid, version = extract_mod_info(mod_file)
+    for modid, version in extract_mods_info(sorted(MODS_DIR.glob("*.zip"))):
         mods.append({"name": modid, "version": version})
 
     include_configs = 'n'
     if ask_for_configs:
         include_configs = input("Do you want to include config files in the mod pack? (Y/N): ").strip().lower()
 
-    # Collect all config files (including subfolders) if chosen
-    if include_configs == 'y':
-        for config_file in CONFIG_DIR.glob("**/*"):
-            if config_file.is_file():
-                configs.append(config_file.relative_to(CONFIG_DIR).as_posix())
+    # Collect all config files (including subfolders) if chosen, walking the folder only once
+    config_files = []
+    if include_configs == 'y' and CONFIG_DIR.is_dir():
+        config_files = [(config_file, config_file.relative_to(CONFIG_DIR).as_posix())
+                        for config_file in iter_config_files()]
+        configs = [arcname for _, arcname in config_files]
 
     # Generate pack.json data
     pack_data = {
@@ -218,16 +518,34 @@ def _create_mod_pack_internal(modpack_zip_path: Path, modpack_name: str, ask_for
         "configs": configs
     }
 
-    # Create or overwrite the mod pack zip file
+    # Create or overwrite the mod pack zip file (compression is chosen per entry by _pack_zip_info)
     with zipfile.ZipFile(modpack_zip_path, 'w') as zipf:
         # Write pack.json inside the zip
-        zipf.writestr("pack.json", json.dumps(pack_data, indent=4))
+        zipf.writestr(_pack_zip_info("pack.json"), _json_dumps(pack_data))
 
         # Include configuration files if chosen
-        if include_configs == 'y':
-            for config_file in CONFIG_DIR.glob("**/*"):
-                if config_file.is_file():
-                    zipf.write(config_file, arcname=config_file.relative_to(CONFIG_DIR).as_posix())
+        for config_file, arcname in config_files:
+            with open(config_file, 'rb') as source_file, zipf.open(_pack_zip_info(arcname), 'w') as target_file:
+                shutil.copyfileobj(source_file, target_file, length=COPY_BUFFER_SIZE)
+
+# Helper to list every config file (including subfolders) in a stable order
+def iter_config_files():
+    # os.walk gets file names straight from the directory listing, so no per-entry stat() is needed
+    for root, dirs, files in os.walk(CONFIG_DIR):
+        dirs.sort()
+        for name in sorted(files):
+            yield Path(root, name)
+
+# Helper to build a zip entry for a mod pack with a fixed timestamp (identical inputs give byte-identical packs)
+# Text configs are deflated, files that are already compressed are stored as-is
+def _pack_zip_info(arcname):
+    zinfo = zipfile.ZipInfo(arcname, date_time=PACK_ENTRY_DATE_TIME)
+    if Path(arcname).suffix.lower() in PRECOMPRESSED_EXTENSIONS:
+        zinfo.compress_type = zipfile.ZIP_STORED
+    else:
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.external_attr = 0o644 << 16
+    return zinfo
 
 # Helper to quickly back up the currently installed mods without user interaction
 def backup_installed_mods():
@@ -247,6 +565,36 @@ def backup_installed_mods():
     _create_mod_pack_internal(backup_zip_path, backup_name, ask_for_configs=False)
     print("Backup mod pack created.")
 
+# Helper to pull the mod list out of a Vintage Story log file
+def read_log_mods_line(log_file_path):
+    """
+    Returns the text after the most recent "Mods, sorted by dependency:" marker in the log,
+    or None if the marker is missing. Only the last LOG_TAIL_BYTES of the file are scanned
+    first (as raw bytes); the whole file is searched only if the marker is not in that tail.
+    """
+    with open(log_file_path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - LOG_TAIL_BYTES))
+        tail = f.read()
+        if LOG_MODS_MARKER in tail:
+            return _read_line_after_marker(tail)
+        if size <= LOG_TAIL_BYTES:
+            return None
+        # Search the whole file through a memory map: a single C-level scan that
+        # does not read the (possibly very large) log into memory
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _read_line_after_marker(mm)
+
+def _read_line_after_marker(data):
+    index = data.rfind(LOG_MODS_MARKER)
+    if index == -1:
+        return None
+    start = index + len(LOG_MODS_MARKER)
+    end = data.find(b"\n", start)
+    line = data[start:end] if end != -1 else data[start:]
+    return line.decode("utf-8", errors="replace").strip()
+
 def install_mods_from_log():
     """
     1) Creates a backup of currently installed mods.
@@ -267,26 +615,18 @@ def install_mods_from_log():
         return
 
     # 3) Parse the log file, find the line with "Mods, sorted by dependency:"
-    found_mods = []
-    with open(log_file_path, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            if "Mods, sorted by dependency:" in line:
-                # Example: "Mods, sorted by dependency: game, customtransitionlib, creative, survival, brainfreeze"
-                start_index = line.index("Mods, sorted by dependency:") + len("Mods, sorted by dependency:")
-                mods_part = line[start_index:].strip()
-                # split by comma
-                mods_raw = mods_part.split(",")
-                # strip whitespace from each mod
-                found_mods = [m.strip() for m in mods_raw if m.strip()]
-                break
-
-    if not found_mods:
+    mods_part = read_log_mods_line(log_file_path)
+    if not mods_part:
         print("Could not find any mods in the specified log file. Make sure you selected the correct file.")
         return
 
-    # 4) Remove vanilla mods: 'game', 'creative', 'survival'
-    vanilla_mods = {"game", "creative", "survival"}
-    filtered_mods = [m for m in found_mods if m.lower() not in vanilla_mods]
+    # 4) Split the comma separated list (e.g. "game, customtransitionlib, creative, survival, brainfreeze")
+    #    in a single pass: strip each mod, drop empty entries and vanilla mods ('game', 'creative', 'survival'),
+    #    and drop duplicate entries while keeping the log's order
+    filtered_mods = list(dict.fromkeys(
+        mod for mod in (token.strip() for token in mods_part.split(","))
+        if mod and mod.casefold() not in VANILLA_MODS
+    ))
 
     if not filtered_mods:
         print("No non-vanilla mods were found in the log. Nothing to install.")
@@ -301,19 +641,14 @@ def install_mods_from_log():
         return
 
     # Completely clear Mods folder
-    for mod_file in MODS_DIR.glob("*"):
-        if mod_file.is_file() or mod_file.is_dir():
-            shutil.rmtree(mod_file) if mod_file.is_dir() else mod_file.unlink()
+    clear_directory(MODS_DIR)
 
     # 5) Download each mod found, retrieving the latest version
     print("Attempting to download the latest version of each mod found in the log...")
-    def download_task(modid):
-        download_mod(modid, None)
-
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        executor.map(download_task, filtered_mods)
-
-    print("Mods successfully installed from log file.")
+    if download_mods([(modid, None) for modid in filtered_mods]):
+        print("Finished installing mods from log file, but some mods failed (see above).")
+    else:
+        print("Mods successfully installed from log file.")
 
 # Function to display the main menu
 def main_menu():